@@ -11,6 +11,7 @@ import (
 	"fmt"
 	"regexp"
 	"strconv"
+	"strings"
 
 	"github.com/getsops/sops/v3"
 	"github.com/getsops/sops/v3/logging"
@@ -37,23 +38,65 @@ type stashKey struct {
 	plaintext      interface{}
 }
 
+type stashValue struct {
+	iv []byte
+	// key and ciphertext record the data key and full ENC[...] string seen at decryption time, so that
+	// re-encrypting the unchanged value with the same key can return the ciphertext without redoing the AEAD work
+	key        string
+	ciphertext string
+}
+
+type aeadKey struct {
+	key       string
+	nonceSize int
+}
+
 // Cipher encrypts and decrypts data keys with AES GCM 256
 type Cipher struct {
 	// stash is a map that stores IVs for reuse, so that the ciphertext doesn't change when decrypting and reencrypting
 	// the same values.
-	stash map[stashKey][]byte
+	stash map[stashKey]stashValue
+	// aeads caches the AEAD constructed for a given data key and nonce size, so the AES key schedule and GCM setup
+	// are only computed once per tree walk instead of once per value.
+	aeads map[aeadKey]cipher.AEAD
 }
 
 // NewCipher is the constructor for a new Cipher object
 func NewCipher() Cipher {
 	return Cipher{
-		stash: make(map[stashKey][]byte),
+		stash: make(map[stashKey]stashValue),
+		aeads: make(map[aeadKey]cipher.AEAD),
+	}
+}
+
+// aead returns the AEAD for the provided key and nonce size, reusing a previously constructed one when possible
+func (c Cipher) aead(key []byte, nonceSize int) (cipher.AEAD, error) {
+	k := aeadKey{key: string(key), nonceSize: nonceSize}
+	if gcm, ok := c.aeads[k]; ok {
+		return gcm, nil
+	}
+	aescipher, err := cryptoaes.NewCipher(key)
+	if err != nil {
+		return nil, err
+	}
+	gcm, err := cipher.NewGCMWithNonceSize(aescipher, nonceSize)
+	if err != nil {
+		return nil, err
 	}
+	c.aeads[k] = gcm
+	return gcm, nil
 }
 
-var encre = regexp.MustCompile(`^ENC\[AES256_GCM,data:(.+),iv:(.+),tag:(.+),type:(.+)\]`)
+// The base64 fields never contain commas and the type name never contains a closing bracket, so the
+// negated character classes let the matcher advance without trying alternative group boundaries.
+var encre = regexp.MustCompile(`^ENC\[AES256_GCM,data:([^,]+),iv:([^,]+),tag:([^,]+),type:([^\]]+)\]`)
 
 func parse(value string) (*encryptedValue, error) {
+	// Values that don't carry the sops prefix (e.g. plain comments, which Decrypt is attempted on) can be
+	// rejected with a prefix comparison instead of running the regex.
+	if !strings.HasPrefix(value, "ENC[AES256_GCM,") {
+		return nil, fmt.Errorf("Input string %s does not match sops' data format", value)
+	}
 	matches := encre.FindStringSubmatch(value)
 	if matches == nil {
 		return nil, fmt.Errorf("Input string %s does not match sops' data format", value)
@@ -84,12 +127,7 @@ func (c Cipher) Decrypt(ciphertext string, key []byte, additionalData string) (p
 	if err != nil {
 		return nil, err
 	}
-	aescipher, err := cryptoaes.NewCipher(key)
-	if err != nil {
-		return nil, err
-	}
-
-	gcm, err := cipher.NewGCMWithNonceSize(aescipher, len(encryptedValue.iv))
+	gcm, err := c.aead(key, len(encryptedValue.iv))
 	if err != nil {
 		return nil, err
 	}
@@ -115,7 +153,11 @@ func (c Cipher) Decrypt(ciphertext string, key []byte, additionalData string) (p
 	default:
 		return nil, fmt.Errorf("Unknown datatype: %s", encryptedValue.datatype)
 	}
-	c.stash[stashKey{plaintext: plaintext, additionalData: additionalData}] = encryptedValue.iv
+	c.stash[stashKey{plaintext: plaintext, additionalData: additionalData}] = stashValue{
+		iv:         encryptedValue.iv,
+		key:        string(key),
+		ciphertext: ciphertext,
+	}
 	return plaintext, err
 }
 
@@ -137,23 +179,26 @@ func (c Cipher) Encrypt(plaintext interface{}, key []byte, additionalData string
 	if isEmpty(plaintext) {
 		return "", nil
 	}
-	aescipher, err := cryptoaes.NewCipher(key)
+	stash, stashOK := c.stash[stashKey{plaintext: plaintext, additionalData: additionalData}]
+	if stashOK && stash.key == string(key) {
+		// Same key, IV, plaintext and additional data as at decryption time: the AEAD output is deterministic,
+		// so the recorded ciphertext can be returned without redoing any crypto work.
+		return stash.ciphertext, nil
+	}
+	gcm, err := c.aead(key, nonceSize)
 	if err != nil {
 		return "", fmt.Errorf("Could not initialize AES GCM encryption cipher: %s", err)
 	}
 	var iv []byte
-	if stash, ok := c.stash[stashKey{plaintext: plaintext, additionalData: additionalData}]; !ok {
+	if !stashOK {
 		iv = make([]byte, nonceSize)
 		_, err = rand.Read(iv)
 		if err != nil {
 			return "", fmt.Errorf("Could not generate random bytes for IV: %s", err)
 		}
 	} else {
-		iv = stash
-	}
-	gcm, err := cipher.NewGCMWithNonceSize(aescipher, nonceSize)
-	if err != nil {
-		return "", fmt.Errorf("Could not create GCM: %s", err)
+		// The data key changed (e.g. rotation): reuse the stashed IV but re-encrypt with the new key
+		iv = stash.iv
 	}
 	var plainBytes []byte
 	var encryptedType string
@@ -183,9 +228,20 @@ func (c Cipher) Encrypt(plaintext interface{}, key []byte, additionalData string
 		return "", fmt.Errorf("Value to encrypt has unsupported type %T", value)
 	}
 	out := gcm.Seal(nil, iv, plainBytes, []byte(additionalData))
-	return fmt.Sprintf("ENC[AES256_GCM,data:%s,iv:%s,tag:%s,type:%s]",
-		base64.StdEncoding.EncodeToString(out[:len(out)-cryptoaes.BlockSize]),
-		base64.StdEncoding.EncodeToString(iv),
-		base64.StdEncoding.EncodeToString(out[len(out)-cryptoaes.BlockSize:]),
-		encryptedType), nil
+	data := out[:len(out)-cryptoaes.BlockSize]
+	tag := out[len(out)-cryptoaes.BlockSize:]
+	// Assemble the result in a single preallocated buffer instead of going through fmt's format parser
+	var sb strings.Builder
+	sb.Grow(len("ENC[AES256_GCM,data:,iv:,tag:,type:]") + len(encryptedType) +
+		base64.StdEncoding.EncodedLen(len(data)) + base64.StdEncoding.EncodedLen(len(iv)) + base64.StdEncoding.EncodedLen(len(tag)))
+	sb.WriteString("ENC[AES256_GCM,data:")
+	sb.WriteString(base64.StdEncoding.EncodeToString(data))
+	sb.WriteString(",iv:")
+	sb.WriteString(base64.StdEncoding.EncodeToString(iv))
+	sb.WriteString(",tag:")
+	sb.WriteString(base64.StdEncoding.EncodeToString(tag))
+	sb.WriteString(",type:")
+	sb.WriteString(encryptedType)
+	sb.WriteString("]")
+	return sb.String(), nil
 }
@@ -32,6 +32,8 @@ var (
 	log *logrus.Logger
 	// azkvTTL is the duration after which a MasterKey requires rotation.
 	azkvTTL = time.Hour * 24 * 30 * 6
+	// keyURLRegex matches {vaultUrl}/keys/{keyName}/{keyVersion} key URLs.
+	keyURLRegex = regexp.MustCompile("^(https://[^/]+)/keys/([^/]+)/([^/]+)$")
 )
 
 func init() {
@@ -76,8 +78,7 @@ func NewMasterKey(vaultURL string, keyName string, keyVersion string) *MasterKey
 // NewMasterKeyFromURL takes an Azure Key Vault key URL, and returns a new
 // MasterKey. The URL format is {vaultUrl}/keys/{keyName}/{keyVersion}.
 func NewMasterKeyFromURL(url string) (*MasterKey, error) {
-	re := regexp.MustCompile("^(https://[^/]+)/keys/([^/]+)/([^/]+)$")
-	parts := re.FindStringSubmatch(url)
+	parts := keyURLRegex.FindStringSubmatch(url)
 	if parts == nil || len(parts) < 3 {
 		return nil, fmt.Errorf("could not parse %q into a valid Azure Key Vault MasterKey", url)
 	}
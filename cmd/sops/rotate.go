@@ -51,18 +51,34 @@ func rotate(opts rotateOpts) ([]byte, error) {
 		return nil, err
 	}
 
-	// Add new master keys
-	for _, key := range opts.AddMasterKeys {
-		tree.Metadata.KeyGroups[0] = append(tree.Metadata.KeyGroups[0], key)
+	// Add new master keys, skipping any that are already present
+	if len(opts.AddMasterKeys) > 0 {
+		existing := make(map[string]struct{})
+		for _, groupKey := range tree.Metadata.KeyGroups[0] {
+			existing[groupKey.ToString()] = struct{}{}
+		}
+		for _, key := range opts.AddMasterKeys {
+			if _, ok := existing[key.ToString()]; ok {
+				continue
+			}
+			tree.Metadata.KeyGroups[0] = append(tree.Metadata.KeyGroups[0], key)
+			existing[key.ToString()] = struct{}{}
+		}
 	}
 	// Remove master keys
-	for _, rmKey := range opts.RemoveMasterKeys {
-		for i := range tree.Metadata.KeyGroups {
-			for j, groupKey := range tree.Metadata.KeyGroups[i] {
-				if rmKey.ToString() == groupKey.ToString() {
-					tree.Metadata.KeyGroups[i] = append(tree.Metadata.KeyGroups[i][:j], tree.Metadata.KeyGroups[i][j+1:]...)
+	if len(opts.RemoveMasterKeys) > 0 {
+		toRemove := make(map[string]struct{}, len(opts.RemoveMasterKeys))
+		for _, rmKey := range opts.RemoveMasterKeys {
+			toRemove[rmKey.ToString()] = struct{}{}
+		}
+		for i, group := range tree.Metadata.KeyGroups {
+			kept := group[:0]
+			for _, groupKey := range group {
+				if _, ok := toRemove[groupKey.ToString()]; !ok {
+					kept = append(kept, groupKey)
 				}
 			}
+			tree.Metadata.KeyGroups[i] = kept
 		}
 	}
 
@@ -53,12 +53,16 @@ const (
 func FindConfigFile(start string) (string, error) {
 	filepath := path.Dir(start)
 	for i := 0; i < maxDepth; i++ {
-		_, err := fs.Stat(path.Join(filepath, configFileName))
-		if err != nil {
-			filepath = path.Join(filepath, "..")
-		} else {
-			return path.Join(filepath, configFileName), nil
+		candidate := path.Join(filepath, configFileName)
+		if _, err := fs.Stat(candidate); err == nil {
+			return candidate, nil
+		}
+		parent := path.Join(filepath, "..")
+		if parent == filepath {
+			// We reached the filesystem root; going further up would just stat the same path again.
+			break
 		}
+		filepath = parent
 	}
 	return "", fmt.Errorf("Config file not found")
 }
@@ -1,12 +1,24 @@
 # Load in our dependencies
 import json
 
+
 # Load in our secrets
-with open('config/secret.json', 'r') as file:
-    secret = json.loads(file.read())
-
-# Define our configuration
-common = {
-    'github_oauth_token': secret['github_oauth_token'],
-    'port': 8080,
-}
+def _load_common():
+    with open('config/secret.json', 'r') as file:
+        secret = json.load(file)
+
+    # Define our configuration
+    return {
+        'github_oauth_token': secret['github_oauth_token'],
+        'port': 8080,
+    }
+
+
+# Lazily load our secrets on first `common` access (PEP 562)
+# DEV: This defers reading/parsing the secret file until someone actually
+#   uses the configuration, so importing this module stays cheap
+def __getattr__(name):
+    if name == 'common':
+        globals()['common'] = _load_common()
+        return globals()['common']
+    raise AttributeError(name)
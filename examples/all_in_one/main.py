@@ -1,16 +1,21 @@
 # Load in our dependencies
-from __future__ import absolute_import
-from config.static import common
+import sys
+
+# DEV: We import the module rather than `common` itself so the lazy
+#   `__getattr__` load isn't triggered until `main()` actually runs
+from config import static
 
 
 # Define our main function
 def main():
     # Output our configuration
-    print('Configuration')
-    print('-------------')
-    for key in common:
+    # DEV: We collect all our lines and write them in one go to avoid a
+    #   stdout lock/flush per line
+    lines = ['Configuration', '-------------']
+    for key, val in static.common.items():
         # Example: `port: "8080"`
-        print('{key}: "{val}"'.format(key=key, val=common[key]))
+        lines.append(f'{key}: "{val}"')
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 
 # If this script is being invoked directly, then run our main function
@@ -20,7 +20,8 @@ production = {
 
 }
 
-config = {
+# DEV: Private until the secrets are merged in; access it as `config`
+_config = {
     'common': common,
     'development': development,
     'test': test,
@@ -30,48 +31,100 @@ config = {
 
 def walk(item, fn):
     """Traverse dicts and lists to update keys via `fn`"""
-    # If we are looking at a dict, then traverse each of its branches
-    if isinstance(item, dict):
-        for key in item:
-            # Walk our value
-            walk(item[key], fn)
-
-            # If we are changing our key, then update it
-            new_key = fn(key)
-            if new_key != key:
-                item[new_key] = item[key]
-                del item[key]
-    # Otherwise, if we are looking at a list, walk each of its items
-    elif isinstance(item, list):
-        for val in item:
-            walk(val, fn)
+    # DEV: We use an explicit stack instead of recursion so deeply nested
+    #   configs don't pay a Python stack frame per level (or hit the
+    #   recursion limit)
+    stack = [item]
+    # DEV: Track visited containers by `id` so shared subtrees (the same
+    #   dict/list referenced from multiple keys) are only walked once
+    memo = set()
+    while stack:
+        node = stack.pop()
+        if id(node) in memo:
+            continue
+        memo.add(id(node))
+        # If we are looking at a dict, then traverse each of its branches
+        if isinstance(node, dict):
+            # Snapshot the items first so we never mutate the dict while
+            #   iterating over it
+            changed = False
+            new_items = []
+            for key, val in node.items():
+                # Queue our value for walking
+                stack.append(val)
+
+                # If we are changing our key, then note that we need a rebuild
+                # DEV: The identity check skips the comparison when `fn`
+                #   hands the same string straight back (the common case)
+                new_key = fn(key)
+                if new_key is not key and new_key != key:
+                    changed = True
+                new_items.append((new_key, val))
+            # Rebuild the dict in a single pass (one rehash total) rather
+            #   than paying a lookup + delete + insert per renamed key
+            # DEV: This also keeps the original key order
+            if changed:
+                node.clear()
+                node.update(new_items)
+        # Otherwise, if we are looking at a list, walk each of its items
+        elif isinstance(node, list):
+            stack.extend(node)
+
+
+def _strip_unencrypted(key):
+    """Remove a trailing `_unencrypted` marker from `key`
+
+    Unlike a blanket `str.replace`, this only touches the suffix so keys
+    that merely contain `_unencrypted` mid-string are left alone
+    """
+    return key.removesuffix('_unencrypted')
 
 
 # Merge all of our static secrets onto our config
-# For each of our secrets
-secret_files = [
-    'config/static_github.json',
-]
-for secret_file in secret_files:
-    with open(secret_file, 'r') as file:
-        # Load and parse our JSON
-        data = json.loads(file.read())
+def _load_config():
+    """Merge our secret files into `config`, stripping `_unencrypted` keys"""
+    # For each of our secrets
+    secret_files = [
+        'config/static_github.json',
+    ]
+
+    for secret_file in secret_files:
+        # Parse our JSON
+        # DEV: We deliberately don't persist the merged config anywhere --
+        #   these are decrypted secrets, so they should only ever live in
+        #   this process' memory
+        with open(secret_file, 'r') as file:
+            data = json.load(file)
 
         # Strip off `_unencrypted` from all keys
-        walk(data, lambda key: key.replace('_unencrypted', ''))
+        walk(data, _strip_unencrypted)
 
         # For each of the environments
         for env_key in data:
             # Load in the respective source and target
             env_src = data[env_key]
-            env_target = config[env_key]
+            env_target = _config[env_key]
 
             # Merge info between configs
-            for key in env_src:
-                if key in env_target:
-                    raise AssertionError(
-                        'Expected "{env_key}.{key}" to not be defined already '
-                        'but it was. '
-                        'Please verify no configs are using the same key'
-                        .format(env_key=env_key, key=key))
+            # DEV: The dict-view intersection finds collisions in one
+            #   C-level pass instead of a per-key Python loop
+            overlap = env_src.keys() & env_target.keys()
+            if overlap:
+                raise AssertionError(
+                    'Expected "{env_key}.{keys}" to not be defined already '
+                    'but it was. '
+                    'Please verify no configs are using the same key'
+                    .format(env_key=env_key, keys='", "'.join(sorted(overlap))))
             env_target.update(env_src)
+
+    return _config
+
+
+# Lazily merge our secrets on first `config` access (PEP 562)
+# DEV: This defers reading/parsing the secret files until someone actually
+#   uses the configuration, so importing this module stays cheap
+def __getattr__(name):
+    if name == 'config':
+        globals()['config'] = _load_config()
+        return globals()['config']
+    raise AttributeError(name)
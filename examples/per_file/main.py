@@ -1,26 +1,31 @@
 # Load in our dependencies
-from __future__ import absolute_import
-from config.static import config
+import sys
+
+# DEV: We import the module rather than `config` itself so the lazy
+#   `__getattr__` load isn't triggered until `main()` actually runs
+from config import static
 
 
 # Define our main function
 def main():
     # Output our configuration
+    # DEV: We collect all our lines and write them in one go to avoid a
+    #   stdout lock/flush per line
     # DEV: We use custom keys for a custom sort
-    print('Configuration')
-    print('=============')
+    lines = ['Configuration', '=============']
     for env_key in ('common', 'development', 'test', 'production'):
         # Example: `Environment: common`
         # Example: `-------------------`
-        env_str = 'Environment: {env_key}'.format(env_key=env_key)
-        print(env_str)
-        print(''.join(['-' for char in env_str]))
+        env_str = f'Environment: {env_key}'
+        lines.append(env_str)
+        lines.append('-' * len(env_str))
 
-        env_config = config[env_key]
-        for key in sorted(env_config.keys()):
+        env_config = static.config[env_key]
+        for key, val in sorted(env_config.items()):
             # Example: `port: "8080"`
-            print('{key}: "{val}"'.format(key=key, val=env_config[key]))
-        print('')
+            lines.append(f'{key}: "{val}"')
+        lines.append('')
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 
 # If this script is being invoked directly, then run our main function
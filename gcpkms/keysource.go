@@ -32,6 +32,8 @@ var (
 	gcpkmsTTL = time.Hour * 24 * 30 * 6
 	// log is the global logger for any GCP KMS MasterKey.
 	log *logrus.Logger
+	// resourceIDRegex matches the resource ID format of a GCP KMS key.
+	resourceIDRegex = regexp.MustCompile(`^projects/[^/]+/locations/[^/]+/keyRings/[^/]+/cryptoKeys/[^/]+$`)
 )
 
 func init() {
@@ -208,8 +210,7 @@ func (key *MasterKey) TypeToIdentifier() string {
 // It returns an error if the ResourceID is invalid, or if the setup of the
 // client fails.
 func (key *MasterKey) newKMSClient() (*kms.KeyManagementClient, error) {
-	re := regexp.MustCompile(`^projects/[^/]+/locations/[^/]+/keyRings/[^/]+/cryptoKeys/[^/]+$`)
-	matches := re.FindStringSubmatch(key.ResourceID)
+	matches := resourceIDRegex.FindStringSubmatch(key.ResourceID)
 	if matches == nil {
 		return nil, fmt.Errorf("no valid resource ID found in %q", key.ResourceID)
 	}
@@ -38,6 +38,11 @@ var (
 	// defaultTokenFile is the name of the file in the user's home directory
 	// where a Vault token is expected to be stored.
 	defaultTokenFile = ".vault-token"
+	// prefixedPathRegex matches key paths with a (unsupported) reverse proxy
+	// prefix before the API version.
+	prefixedPathRegex = regexp.MustCompile(`/[^/]+/v[\d]+/[^/]+/[^/]+/[^/]+`)
+	// pathRegex matches correctly formatted key paths.
+	pathRegex = regexp.MustCompile(`/v[\d]+/[^/]+/[^/]+/[^/]+`)
 )
 
 // Token used for authenticating towards a Vault server.
@@ -350,11 +355,11 @@ func engineAndKeyFromPath(fullPath string) (enginePath, keyName string, err erro
 	// supported by the Vault client API. Check for this here.
 	// TODO(hidde): this may no longer be necessary with newer Vault versions,
 	//  but needs to be confirmed.
-	if re := regexp.MustCompile(`/[^/]+/v[\d]+/[^/]+/[^/]+/[^/]+`); re.Match([]byte(fullPath)) {
+	if prefixedPathRegex.MatchString(fullPath) {
 		err = fmt.Errorf("running Vault with a prefixed URL is not supported! (Format has to be like " +
 			"https://vault.example.com:8200/v1/transit/keys/keyName)")
 		return
-	} else if re := regexp.MustCompile(`/v[\d]+/[^/]+/[^/]+/[^/]+`); !re.Match([]byte(fullPath)) {
+	} else if !pathRegex.MatchString(fullPath) {
 		err = fmt.Errorf("vault path does not seem to be formatted correctly: (eg. " +
 			"https://vault.example.com:8200/v1/transit/keys/keyName)")
 		return
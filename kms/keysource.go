@@ -25,12 +25,6 @@ import (
 )
 
 const (
-	// arnRegex matches an AWS ARN, for example:
-	// "arn:aws:kms:us-west-2:107501996527:key/612d5f0p-p1l3-45e6-aca6-a5b005693a48".
-	arnRegex = `^arn:aws[\w-]*:kms:(.+):[0-9]+:(key|alias)/.+$`
-	// stsSessionRegex matches an AWS STS session name, for example:
-	// "john_s", "sops@42WQm042".
-	stsSessionRegex = "[^a-zA-Z0-9=,.@-_]+"
 	// roleSessionNameLengthLimit is the AWS role session name length limit.
 	roleSessionNameLengthLimit = 64
 	// kmsTTL is the duration after which a MasterKey requires rotation.
@@ -40,6 +34,12 @@ const (
 )
 
 var (
+	// arnRegex matches an AWS ARN, for example:
+	// "arn:aws:kms:us-west-2:107501996527:key/612d5f0p-p1l3-45e6-aca6-a5b005693a48".
+	arnRegex = regexp.MustCompile(`^arn:aws[\w-]*:kms:(.+):[0-9]+:(key|alias)/.+$`)
+	// stsSessionRegex matches an AWS STS session name, for example:
+	// "john_s", "sops@42WQm042".
+	stsSessionRegex = regexp.MustCompile("[^a-zA-Z0-9=,.@-_]+")
 	// log is the global logger for any AWS KMS MasterKey.
 	log *logrus.Logger
 	// osHostname returns the hostname as reported by the kernel.
@@ -308,8 +308,7 @@ func (key *MasterKey) TypeToIdentifier() string {
 // createKMSConfig returns an AWS config with the credentialsProvider of the
 // MasterKey, or the default configuration sources.
 func (key MasterKey) createKMSConfig() (*aws.Config, error) {
-	re := regexp.MustCompile(arnRegex)
-	matches := re.FindStringSubmatch(key.Arn)
+	matches := arnRegex.FindStringSubmatch(key.Arn)
 	if matches == nil {
 		return nil, fmt.Errorf("no valid ARN found in '%s'", key.Arn)
 	}
@@ -380,8 +379,7 @@ func stsSessionName() (string, error) {
 		return "", fmt.Errorf("failed to construct STS session name: %w", err)
 	}
 
-	re := regexp.MustCompile(stsSessionRegex)
-	sanitizedHostname := re.ReplaceAllString(hostname, "")
+	sanitizedHostname := stsSessionRegex.ReplaceAllString(hostname, "")
 
 	name := "sops@" + sanitizedHostname
 	if len(name) >= roleSessionNameLengthLimit {
@@ -17,6 +17,7 @@ import (
 	"os/user"
 	"path/filepath"
 	"strings"
+	"sync"
 	"time"
 
 	"github.com/ProtonMail/go-crypto/openpgp"
@@ -553,20 +554,47 @@ func (key *MasterKey) passphrasePrompt() func(keys []openpgp.Key, symmetric bool
 	}
 }
 
+// ringCacheEntry is the raw contents of a keyring file together with the
+// file metadata it was read at, used to detect staleness.
+type ringCacheEntry struct {
+	modTime time.Time
+	size    int64
+	raw     []byte
+}
+
+var (
+	// ringCache caches raw keyring file contents by path, so operations
+	// spanning multiple PGP master keys do not re-read the same keyring file
+	// for every key. Entries are refreshed when the file changes on disk.
+	// Only the bytes are cached, never the parsed entities: callers mutate
+	// the returned ring (e.g. decrypting private keys in place), so every
+	// call must get its own freshly parsed copy.
+	ringCache   = make(map[string]ringCacheEntry)
+	ringCacheMu sync.Mutex
+)
+
 // loadRing attempts to load the keyring from the provided path.
 // Unsupported keys are ignored as long as at least a single valid key is
 // found.
 func loadRing(path string) (openpgp.EntityList, error) {
-	f, err := os.Open(path)
+	fi, err := os.Stat(path)
 	if err != nil {
 		return nil, err
 	}
-	defer f.Close()
-	keyring, err := openpgp.ReadKeyRing(f)
-	if err != nil {
-		return nil, err
+	ringCacheMu.Lock()
+	entry, ok := ringCache[path]
+	ringCacheMu.Unlock()
+	if !ok || !entry.modTime.Equal(fi.ModTime()) || entry.size != fi.Size() {
+		raw, err := os.ReadFile(path)
+		if err != nil {
+			return nil, err
+		}
+		entry = ringCacheEntry{modTime: fi.ModTime(), size: fi.Size(), raw: raw}
+		ringCacheMu.Lock()
+		ringCache[path] = entry
+		ringCacheMu.Unlock()
 	}
-	return keyring, nil
+	return openpgp.ReadKeyRing(bytes.NewReader(entry.raw))
 }
 
 // fingerprintIndex indexes the openpgp.Entity objects from the given ring
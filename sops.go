@@ -46,6 +46,7 @@ import (
 	"sort"
 	"strconv"
 	"strings"
+	"sync"
 	"time"
 
 	"github.com/sirupsen/logrus"
@@ -381,6 +382,29 @@ func (branch TreeBranch) walkBranch(in TreeBranch, path []string, commentsStack
 	return in, nil
 }
 
+// regexCache holds the compiled patterns from the metadata's *Regex settings, which would otherwise be
+// recompiled for every path component of every value during a tree walk.
+var (
+	regexCache   = make(map[string]*regexp.Regexp)
+	regexCacheMu sync.Mutex
+)
+
+// matchRegex reports whether pattern matches s, compiling each pattern at most once. Like regexp.Match,
+// it treats an invalid pattern as a non-match.
+func matchRegex(pattern string, s string) bool {
+	regexCacheMu.Lock()
+	re, ok := regexCache[pattern]
+	if !ok {
+		re, _ = regexp.Compile(pattern)
+		regexCache[pattern] = re
+	}
+	regexCacheMu.Unlock()
+	if re == nil {
+		return false
+	}
+	return re.MatchString(s)
+}
+
 func (tree Tree) shouldBeEncrypted(path []string, commentsStack [][]string, isComment bool) bool {
 	encrypted := true
 	if tree.Metadata.UnencryptedSuffix != "" {
@@ -402,8 +426,7 @@ func (tree Tree) shouldBeEncrypted(path []string, commentsStack [][]string, isCo
 	}
 	if tree.Metadata.UnencryptedRegex != "" {
 		for _, p := range path {
-			matched, _ := regexp.Match(tree.Metadata.UnencryptedRegex, []byte(p))
-			if matched {
+			if matchRegex(tree.Metadata.UnencryptedRegex, p) {
 				encrypted = false
 				break
 			}
@@ -412,8 +435,7 @@ func (tree Tree) shouldBeEncrypted(path []string, commentsStack [][]string, isCo
 	if tree.Metadata.EncryptedRegex != "" {
 		encrypted = false
 		for _, p := range path {
-			matched, _ := regexp.Match(tree.Metadata.EncryptedRegex, []byte(p))
-			if matched {
+			if matchRegex(tree.Metadata.EncryptedRegex, p) {
 				encrypted = true
 				break
 			}
@@ -423,8 +445,7 @@ func (tree Tree) shouldBeEncrypted(path []string, commentsStack [][]string, isCo
 	unencryptedComments:
 		for _, cs := range commentsStack {
 			for _, c := range cs {
-				matched, _ := regexp.Match(tree.Metadata.UnencryptedCommentRegex, []byte(c))
-				if matched {
+				if matchRegex(tree.Metadata.UnencryptedCommentRegex, c) {
 					encrypted = false
 					break unencryptedComments
 				}
@@ -444,8 +465,7 @@ func (tree Tree) shouldBeEncrypted(path []string, commentsStack [][]string, isCo
 				if isComment && i == lenCommentsStack-1 && j == lenLastCommentsStack-1 {
 					continue
 				}
-				matched, _ := regexp.Match(tree.Metadata.EncryptedCommentRegex, []byte(c))
-				if matched {
+				if matchRegex(tree.Metadata.EncryptedCommentRegex, c) {
 					encrypted = true
 					break encryptedComments
 				}
@@ -501,8 +521,7 @@ func (tree Tree) Encrypt(key []byte, cipher Cipher) (string, error) {
 				if ok && tree.Metadata.UnencryptedCommentRegex != "" {
 					// If an encrypted comment matches tree.Metadata.UnencryptedCommentRegex, decryption will fail
 					// as the MAC does not match, and the commented value will not be decrypted.
-					matched, _ := regexp.Match(tree.Metadata.UnencryptedCommentRegex, []byte(in.(string)))
-					if matched {
+					if matchRegex(tree.Metadata.UnencryptedCommentRegex, in.(string)) {
 						return nil, fmt.Errorf("Encrypted comment %q matches UnencryptedCommentRegex! Make sure that UnencryptedCommentRegex cannot match an encrypted comment.", in)
 					}
 				}